@@ -1,8 +1,14 @@
 import unittest
+import io
+import threading
+import time
+from contextlib import redirect_stdout
+from main import LazyManager, ScriptedInput, main
 from manage_books import BookManager, BookSearchStrategy, AdvancedBookSearchStrategy, SimpleBookSearchStrategy, Book
 from datetime import datetime
-from manage_checkouts import CheckoutManager, Checkout, CheckoutHistory
-from manage_users import UserManager, UserBuilder, SimpleUserSearch, User
+from manage_checkouts import CheckoutManager, Checkout, CheckoutHistory, BatchItemResult
+from manage_migration import LegacyMigrator, batched
+from manage_users import UserManager, UserBuilder, SimpleUserSearch, User, EmailUserSearch, NameTokenUserSearch, EmailPrefixUserSearch, EmailDomainUserSearch, DobRangeUserSearch, JoiningDateRangeUserSearch
 
 class TestBookManager(unittest.TestCase):
     def setUp(self):
@@ -33,6 +39,10 @@ class TestBookManager(unittest.TestCase):
         self.assertFalse(self.book_manager.add_book("Title2", "Author2", "0596007973"))
         self.assertEqual(len(self.book_manager.books), 1)  
 
+        # Test adding the same ISBN written with hyphens
+        self.assertFalse(self.book_manager.add_book("Title2", "Author2", "0-596-00797-3"))
+        self.assertEqual(len(self.book_manager.books), 1)
+
     def test_remove_book(self):
         # Test removing a book
         self.book_manager.add_book("Title1", "Author1", "0132350882")
@@ -89,6 +99,7 @@ class TestCheckoutManager(unittest.TestCase):
         book = Book("Test Book", "Test Author", "1234567890")
         checkout_instance = Checkout(user, book)
         self.checkout_manager.checkouts.append(checkout_instance)
+        self.checkout_manager.active_checkouts[(user.user_id, book.isbn)] = checkout_instance
         self.checkout_manager.history.history.append(checkout_instance)
 
         # Return the book
@@ -102,6 +113,132 @@ class TestCheckoutManager(unittest.TestCase):
         self.assertEqual(user.active_books, 0)
         self.assertEqual(len(self.checkout_manager.history.history), 2)
 
+class TestBatchCheckout(unittest.TestCase):
+    def setUp(self):
+        CheckoutManager._instance = None
+        self.checkout_manager = CheckoutManager()
+        self.book_manager = BookManager()
+        self.book_manager.add_book("Title1", "Author1", "0132350882")
+        self.book_manager.add_book("Title2", "Author2", "0596007973")
+        self.book_manager.add_book("Title3", "Author3", "0201633612")
+        self.user = User("test@example.com", "Test User", "1999-01-01")
+
+    def tearDown(self):
+        CheckoutManager._instance = None
+
+    def test_checkout_books(self):
+        results = self.checkout_manager.checkout_books(
+            [(self.user, "0132350882"), (self.user, "0596007973")], self.book_manager)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(isinstance(result, BatchItemResult) and result.success for result in results))
+        self.assertEqual(len(self.checkout_manager.checkouts), 2)
+        self.assertEqual(self.user.active_books, 2)
+        self.assertFalse(self.book_manager._find_book_by_isbn("0132350882").available)
+
+    def test_checkout_books_is_all_or_nothing(self):
+        results = self.checkout_manager.checkout_books(
+            [(self.user, "0132350882"), (self.user, "1111111111")], self.book_manager)
+        self.assertFalse(any(result.success for result in results))
+        self.assertEqual(results[0].message, "Batch aborted")
+        self.assertEqual(results[1].message, "Book not found")
+        self.assertEqual(len(self.checkout_manager.checkouts), 0)
+        self.assertEqual(self.user.active_books, 0)
+        self.assertTrue(self.book_manager._find_book_by_isbn("0132350882").available)
+
+    def test_checkout_books_enforces_limit_across_batch(self):
+        self.user.modify_borrow_limit(2)
+        results = self.checkout_manager.checkout_books(
+            [(self.user, "0132350882"), (self.user, "0596007973"), (self.user, "0201633612")], self.book_manager)
+        self.assertFalse(results[2].success)
+        self.assertEqual(results[2].message, "User Test User has borrowed too many books.")
+        self.assertEqual(len(self.checkout_manager.checkouts), 0)
+
+    def test_checkout_books_rejects_duplicate_isbn(self):
+        other = User("other@example.com", "Other User", "1990-01-01")
+        results = self.checkout_manager.checkout_books(
+            [(self.user, "0132350882"), (other, "0132350882")], self.book_manager)
+        self.assertFalse(results[1].success)
+        self.assertEqual(len(self.checkout_manager.checkouts), 0)
+
+    def test_return_books(self):
+        self.checkout_manager.checkout_books(
+            [(self.user, "0132350882"), (self.user, "0596007973")], self.book_manager)
+        results = self.checkout_manager.return_books(
+            [(self.user, "0132350882"), (self.user, "0596007973")], self.book_manager)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(self.user.active_books, 0)
+        self.assertTrue(all(checkout.return_date for checkout in self.checkout_manager.checkouts))
+        self.assertTrue(self.book_manager._find_book_by_isbn("0596007973").available)
+
+    def test_return_books_is_all_or_nothing(self):
+        self.checkout_manager.checkout_books([(self.user, "0132350882")], self.book_manager)
+        results = self.checkout_manager.return_books(
+            [(self.user, "0132350882"), (self.user, "0596007973")], self.book_manager)
+        self.assertFalse(any(result.success for result in results))
+        self.assertEqual(self.user.active_books, 1)
+        self.assertIsNone(self.checkout_manager.checkouts[0].return_date)
+        self.assertFalse(self.book_manager._find_book_by_isbn("0132350882").available)
+
+    def test_return_books_uses_active_checkouts(self):
+        self.checkout_manager.checkout_books([(self.user, "0132350882")], self.book_manager)
+        self.assertIn((self.user.user_id, "0132350882"), self.checkout_manager.active_checkouts)
+        self.checkout_manager.return_books([(self.user, "0132350882")], self.book_manager)
+        self.assertEqual(self.checkout_manager.active_checkouts, {})
+
+        # Returning twice in one batch or after the return fails validation
+        results = self.checkout_manager.return_books([(self.user, "0132350882")], self.book_manager)
+        self.assertFalse(results[0].success)
+
+    def test_return_book_after_borrowing_again(self):
+        book = self.book_manager._find_book_by_isbn("0132350882")
+        self.checkout_manager.checkout_book(self.user, book)
+        self.checkout_manager.return_book(self.user, book)
+        self.checkout_manager.checkout_book(self.user, book)
+        self.assertTrue(self.checkout_manager.return_book(self.user, book))
+        self.assertTrue(book.available)
+        self.assertEqual(self.user.active_books, 0)
+        self.assertFalse(self.checkout_manager.return_book(self.user, book))
+
+    def test_checkout_books_rolls_back_on_error(self):
+        other = User("other@example.com", "Other User", "1990-01-01")
+        self.checkout_manager.checkout_books([(other, "0201633612")], self.book_manager)
+        book = self.book_manager._find_book_by_isbn("0596007973")
+
+        def fail_on_checkout(availability):
+            if not availability:
+                raise RuntimeError("shelf unavailable")
+            book.available = availability
+        book.set_availability = fail_on_checkout
+
+        results = self.checkout_manager.checkout_books(
+            [(self.user, "0132350882"), (self.user, "0596007973")], self.book_manager)
+        self.assertFalse(any(result.success for result in results))
+        self.assertEqual(len(self.checkout_manager.checkouts), 1)
+        self.assertEqual(len(self.checkout_manager.history.history), 1)
+        self.assertEqual(len(self.checkout_manager.active_checkouts), 1)
+        self.assertEqual((self.user.active_books, self.user.books_borrowed), (0, 0))
+        self.assertTrue(self.book_manager._find_book_by_isbn("0132350882").available)
+
+    def test_return_books_rolls_back_on_error(self):
+        self.checkout_manager.checkout_books(
+            [(self.user, "0132350882"), (self.user, "0596007973")], self.book_manager)
+        book = self.book_manager._find_book_by_isbn("0596007973")
+
+        def fail_on_return(availability):
+            if availability:
+                raise RuntimeError("shelf unavailable")
+            book.available = availability
+        book.set_availability = fail_on_return
+
+        results = self.checkout_manager.return_books(
+            [(self.user, "0132350882"), (self.user, "0596007973")], self.book_manager)
+        self.assertFalse(any(result.success for result in results))
+        self.assertEqual(self.user.active_books, 2)
+        self.assertEqual(self.user.books_borrowed, 2)
+        self.assertEqual(len(self.checkout_manager.active_checkouts), 2)
+        self.assertTrue(all(checkout.return_date is None for checkout in self.checkout_manager.checkouts))
+        self.assertFalse(self.book_manager._find_book_by_isbn("0132350882").available)
+
 class TestUserManager(unittest.TestCase):
     def setUp(self):
         self.user_manager = UserManager()
@@ -132,6 +269,328 @@ class TestUserManager(unittest.TestCase):
         self.assertEqual(len(search_results), 1)
         self.assertEqual(search_results[0].name, "Ashish")
 
+class TestIndexedUserSearch(unittest.TestCase):
+    def setUp(self):
+        UserManager._instance = None
+        self.user_manager = UserManager()
+        self.user_manager.add_user("Rohan Kumar", "rohan@example.com", "1990-01-01")
+        self.user_manager.add_user("Ashish Rohan", "ashish@library.org", "1985-05-15")
+        self.user_manager.add_user("Suman Kumar", "Suman@Example.com", "1995-07-20")
+
+    def tearDown(self):
+        UserManager._instance = None
+
+    def test_email_search(self):
+        results = self.user_manager.search_users("suman@example.com", EmailUserSearch())
+        self.assertEqual([user.name for user in results], ["Suman Kumar"])
+        self.assertEqual(self.user_manager.search_users("rohan@", EmailUserSearch()), [])
+
+    def test_name_token_search(self):
+        results = self.user_manager.search_users("rohan", NameTokenUserSearch())
+        self.assertEqual([user.name for user in results], ["Rohan Kumar", "Ashish Rohan"])
+        results = self.user_manager.search_users("Kumar Rohan", NameTokenUserSearch())
+        self.assertEqual([user.name for user in results], ["Rohan Kumar"])
+        results = self.user_manager.search_users("roh", NameTokenUserSearch())
+        self.assertEqual([user.name for user in results], ["Rohan Kumar", "Ashish Rohan"])
+        results = self.user_manager.search_users("ku roh", NameTokenUserSearch())
+        self.assertEqual([user.name for user in results], ["Rohan Kumar"])
+        self.assertEqual(self.user_manager.search_users("rohit", NameTokenUserSearch()), [])
+
+    def test_email_prefix_search(self):
+        results = self.user_manager.search_users("su", EmailPrefixUserSearch())
+        self.assertEqual([user.name for user in results], ["Suman Kumar"])
+        results = self.user_manager.search_users("A", EmailPrefixUserSearch())
+        self.assertEqual([user.name for user in results], ["Ashish Rohan"])
+        self.assertEqual(self.user_manager.search_users("x", EmailPrefixUserSearch()), [])
+
+    def test_email_domain_search(self):
+        results = self.user_manager.search_users("example.com", EmailDomainUserSearch())
+        self.assertEqual([user.name for user in results], ["Rohan Kumar", "Suman Kumar"])
+        results = self.user_manager.search_users("@library.org", EmailDomainUserSearch())
+        self.assertEqual([user.name for user in results], ["Ashish Rohan"])
+
+    def test_dob_range_search(self):
+        results = self.user_manager.search_users(("1985-05-15", "1990-01-01"), DobRangeUserSearch())
+        self.assertEqual([user.name for user in results], ["Ashish Rohan", "Rohan Kumar"])
+        results = self.user_manager.search_users(("1991-01-01", None), DobRangeUserSearch())
+        self.assertEqual([user.name for user in results], ["Suman Kumar"])
+
+    def test_joining_date_range_search(self):
+        today = datetime.now().date()
+        results = self.user_manager.search_users((today, today), JoiningDateRangeUserSearch())
+        self.assertEqual(len(results), 3)
+        self.assertEqual(self.user_manager.search_users((None, "2000-01-01"), JoiningDateRangeUserSearch()), [])
+
+    def test_search_pagination(self):
+        results = self.user_manager.search_users((None, None), DobRangeUserSearch(), page=1, page_size=2)
+        self.assertEqual([user.name for user in results], ["Ashish Rohan", "Rohan Kumar"])
+        results = self.user_manager.search_users((None, None), DobRangeUserSearch(), page=2, page_size=2)
+        self.assertEqual([user.name for user in results], ["Suman Kumar"])
+        results = self.user_manager.search_users("kumar", NameTokenUserSearch(), page=2, page_size=1)
+        self.assertEqual([user.name for user in results], ["Suman Kumar"])
+
+    def test_invalid_page(self):
+        with self.assertRaises(ValueError):
+            self.user_manager.search_users((None, None), DobRangeUserSearch(), page=0, page_size=2)
+        with self.assertRaises(ValueError):
+            self.user_manager.search_users("rohan", SimpleUserSearch(), page=1, page_size=0)
+
+    def test_range_pagination_within_same_date(self):
+        self.user_manager.add_user("Rahul", "rahul@example.com", "1990-01-01")
+        self.user_manager.add_user("Priya", "priya@example.com", "1990-01-01")
+        results = self.user_manager.search_users(("1990-01-01", "1995-12-31"), DobRangeUserSearch(), page=2, page_size=2)
+        self.assertEqual([user.name for user in results], ["Priya", "Suman Kumar"])
+
+    def test_empty_fields_are_not_indexed(self):
+        self.user_manager.add_user("Legacy User", "", "", user_id="legacy-1")
+        self.assertEqual(self.user_manager.search_users("", EmailUserSearch()), [])
+        self.assertEqual(self.user_manager.search_users("", EmailDomainUserSearch()), [])
+        self.assertEqual(self.user_manager.search_users((None, "1950-01-01"), DobRangeUserSearch()), [])
+        self.assertEqual(self.user_manager._find_user_by_id("legacy-1").name, "Legacy User")
+
+class TestLegacyMigrator(unittest.TestCase):
+    def setUp(self):
+        UserManager._instance = None
+        CheckoutManager._instance = None
+        self.migrator = LegacyMigrator(batch_size=2)
+
+    def tearDown(self):
+        UserManager._instance = None
+        CheckoutManager._instance = None
+
+    def test_batched(self):
+        self.assertEqual(list(batched(iter(range(5)), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_migrate(self):
+        books = [
+            {"title": "Title1", "author": "Author1", "isbn": "0132350882"},
+            {"title": "Title2", "author": "Author2", "isbn": "0132350889"},
+            {"title": "Title1", "author": "Author1", "isbn": "0132350882"},
+            {"title": "Title3", "author": "Author3", "isbn": "0596007973"},
+        ]
+        users = [{"name": "Rohan", "user_id": "u1"}, {"name": "Rohan", "user_id": "u1"}, {"name": "Ashish", "user_id": "u2"}]
+        checkouts = [
+            {"user_id": "u1", "isbn": "0132350882"},
+            {"user_id": "u3", "isbn": "0596007973"},
+            {"user_id": "u2", "isbn": "0132350882"},
+        ]
+        book_report, user_report, checkout_report = self.migrator.migrate(iter(books), iter(users), iter(checkouts))
+
+        self.assertEqual(book_report.migrated, 2)
+        self.assertEqual(book_report.skipped["invalid ISBN"], 1)
+        self.assertEqual(book_report.skipped["duplicate ISBN"], 1)
+        self.assertEqual(user_report.migrated, 2)
+        self.assertEqual(user_report.skipped["duplicate user"], 1)
+        self.assertEqual(checkout_report.migrated, 1)
+        self.assertEqual(checkout_report.skipped["unknown user"], 1)
+        self.assertEqual(checkout_report.skipped["book already checked out"], 1)
+
+        user = self.migrator.user_manager._find_user_by_id("u1")
+        self.assertEqual(user.name, "Rohan")
+        self.assertEqual(user.active_books, 1)
+        self.assertFalse(self.migrator.book_manager._find_book_by_isbn("0132350882").available)
+        self.assertEqual(len(self.migrator.checkout_manager.checkouts), 1)
+
+        stats = self.migrator.book_manager.stats
+        self.assertEqual(stats.active_loans, 1)
+        self.assertEqual(stats.most_borrowed_today(), [])
+
+    def test_migrate_normalizes_isbn(self):
+        books = [
+            {"title": "Title1", "author": "Author1", "isbn": "0-596-00797-3"},
+            {"title": "Title1", "author": "Author1", "isbn": "0596007973"},
+        ]
+        users = [{"name": "Rohan", "user_id": "u1"}]
+        checkouts = [{"user_id": "u1", "isbn": "0 596 00797 3"}]
+        book_report, _, checkout_report = self.migrator.migrate(iter(books), iter(users), iter(checkouts))
+
+        self.assertEqual(book_report.migrated, 1)
+        self.assertEqual(book_report.skipped["duplicate ISBN"], 1)
+        self.assertEqual(self.migrator.book_manager.get_all_books()[0].isbn, "0596007973")
+        self.assertEqual(checkout_report.migrated, 1)
+
+class TestLibraryStats(unittest.TestCase):
+    def setUp(self):
+        CheckoutManager._instance = None
+        self.book_manager = BookManager()
+        self.stats = self.book_manager.stats
+        self.checkout_manager = CheckoutManager(self.stats)
+        self.book_manager.add_book("Title1", "Author1", "0132350882")
+        self.book_manager.add_book("Title2", "Author2", "0596007973")
+        self.book_manager.add_book("Title3", "Author3", "0201633612")
+        self.user = User("test@example.com", "Test User", "1999-01-01")
+        self.other = User("other@example.com", "Other User", "1990-01-01")
+
+    def tearDown(self):
+        CheckoutManager._instance = None
+
+    def test_book_counts(self):
+        self.assertEqual(self.stats.total_books, 3)
+        self.assertEqual(self.stats.available_books, 3)
+        self.book_manager.remove_book("0201633612")
+        self.assertEqual(self.stats.total_books, 2)
+        self.assertEqual(self.stats.available_books, 2)
+
+    def test_loan_counts(self):
+        book = self.book_manager._find_book_by_isbn("0132350882")
+        self.checkout_manager.checkout_book(self.user, book)
+        self.assertEqual(self.stats.available_books, 2)
+        self.assertEqual(self.stats.active_loans, 1)
+        self.assertEqual(self.stats.loans_for(self.user.user_id), 1)
+
+        self.checkout_manager.return_book(self.user, book)
+        self.assertEqual(self.stats.available_books, 3)
+        self.assertEqual(self.stats.active_loans, 0)
+        self.assertEqual(self.stats.loans_for(self.user.user_id), 0)
+
+    def test_most_borrowed_today(self):
+        book = self.book_manager._find_book_by_isbn("0132350882")
+        self.checkout_manager.checkout_book(self.user, book)
+        self.checkout_manager.return_book(self.user, book)
+        self.checkout_manager.checkout_books([(self.other, "0132350882"), (self.other, "0596007973")], self.book_manager)
+        self.assertEqual(self.stats.most_borrowed_today(), [("0132350882", "Title1", 2), ("0596007973", "Title2", 1)])
+
+    def test_aborted_batch_leaves_counts(self):
+        self.checkout_manager.checkout_books([(self.user, "0132350882"), (self.user, "1111111111")], self.book_manager)
+        self.assertEqual(self.stats.available_books, 3)
+        self.assertEqual(self.stats.active_loans, 0)
+        self.assertEqual(self.stats.most_borrowed_today(), [])
+
+    def test_remove_book_on_loan(self):
+        book = self.book_manager._find_book_by_isbn("0132350882")
+        self.checkout_manager.checkout_book(self.user, book)
+        self.book_manager.remove_book("0132350882")
+        self.checkout_manager.return_book(self.user, book)
+        self.assertEqual(self.stats.total_books, 2)
+        self.assertEqual(self.stats.available_books, 2)
+        self.assertEqual(self.stats.active_loans, 0)
+        self.assertEqual(self.stats.loans_for(self.user.user_id), 0)
+
+    def test_stats_belong_to_their_book_manager(self):
+        other_manager = BookManager()
+        other_manager.add_book("Title4", "Author4", "0132350882")
+        self.assertEqual(self.stats.total_books, 3)
+        self.assertEqual(other_manager.stats.total_books, 1)
+
+        # Loans of books outside the catalogue are not counted
+        self.checkout_manager.checkout_book(self.user, Book("Test Book", "Test Author", "1234567890"))
+        self.checkout_manager.checkout_book(self.other, other_manager._find_book_by_isbn("0132350882"))
+        self.assertEqual(self.stats.available_books, 3)
+        self.assertEqual(self.stats.active_loans, 0)
+
+    def test_rebinding_stats_with_active_loans(self):
+        book = self.book_manager._find_book_by_isbn("0132350882")
+        self.checkout_manager.checkout_book(self.user, book)
+        self.assertIs(CheckoutManager(self.stats), self.checkout_manager)
+        with self.assertRaises(ValueError):
+            CheckoutManager(BookManager().stats)
+        self.assertIs(self.checkout_manager.stats, self.stats)
+
+        self.checkout_manager.return_book(self.user, book)
+        other_stats = BookManager().stats
+        self.assertIs(CheckoutManager(other_stats).stats, other_stats)
+
+    def test_failed_checkout_leaves_counts(self):
+        book = self.book_manager._find_book_by_isbn("0132350882")
+
+        def fail_on_checkout(availability):
+            if not availability:
+                raise RuntimeError("shelf unavailable")
+            book.available = availability
+        book.set_availability = fail_on_checkout
+
+        self.assertFalse(self.checkout_manager.checkout_book(self.user, book))
+        self.assertEqual(self.stats.available_books, 3)
+        self.assertEqual(self.stats.active_loans, 0)
+        self.assertEqual(self.stats.most_borrowed_today(), [])
+        self.assertEqual(self.user.active_books, 0)
+
+class TestLazyManager(unittest.TestCase):
+    def test_builds_on_get(self):
+        calls = []
+        lazy = LazyManager(lambda: calls.append(1) or "manager")
+        self.assertFalse(lazy.is_ready())
+        self.assertEqual(lazy.get(), "manager")
+        self.assertEqual(lazy.get(), "manager")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(lazy.upper(), "MANAGER")
+
+    def test_get_joins_running_warm_up(self):
+        threads = []
+
+        def factory():
+            time.sleep(0.05)
+            threads.append(threading.current_thread())
+            return "manager"
+
+        lazy = LazyManager(factory)
+        lazy.warm_up()
+        lazy.warm_up()
+        self.assertEqual(lazy.get(), "manager")
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_get_reraises_factory_error(self):
+        def factory():
+            raise RuntimeError("catalog unavailable")
+
+        lazy = LazyManager(factory)
+        lazy.warm_up()
+        with self.assertRaises(RuntimeError):
+            lazy.get()
+
+class TestScriptedInput(unittest.TestCase):
+    def test_echoes_answers_and_exits_at_end(self):
+        read = ScriptedInput(io.StringIO("yes\r\nrohan@example.com\n"))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(read("Do you have an account? (yes/no): "), "yes")
+            self.assertEqual(read("Enter your email: "), "rohan@example.com")
+            with self.assertRaises(SystemExit):
+                read("Enter your choice: ")
+        self.assertIn("Do you have an account? (yes/no): yes\n", output.getvalue())
+        self.assertIn("End of batch input.", output.getvalue())
+
+class TestScriptedMain(unittest.TestCase):
+    def setUp(self):
+        UserManager._instance = None
+        CheckoutManager._instance = None
+
+    def tearDown(self):
+        UserManager._instance = None
+        CheckoutManager._instance = None
+
+    def test_scripted_session(self):
+        script = "\n".join([
+            "no", "Rohan", "rohan@example.com", "1990-01-01",
+            "1", "Title1", "Author1", "0132350882",
+            "6", "0132350882",
+            "8",
+            "9",
+        ])
+        output = io.StringIO()
+        with redirect_stdout(output), self.assertRaises(SystemExit):
+            main(ScriptedInput(io.StringIO(script)))
+        self.assertIn("Ready in", output.getvalue())
+        self.assertIn("Book checked out successfully", output.getvalue())
+        self.assertIn("User: Rohan, Book: Title1", output.getvalue())
+        self.assertIn("Exiting the program.", output.getvalue())
+
+    def test_scripted_session_with_hyphenated_isbn(self):
+        script = "\n".join([
+            "no", "Rohan", "rohan@example.com", "1990-01-01",
+            "1", "Title1", "Author1", "0-596-00797-3",
+            "6", "0-596-00797-3",
+            "7", "0-596-00797-3",
+            "9",
+        ])
+        output = io.StringIO()
+        with redirect_stdout(output), self.assertRaises(SystemExit):
+            main(ScriptedInput(io.StringIO(script)))
+        self.assertIn("Book checked out successfully", output.getvalue())
+        self.assertIn("Book returned successfully!", output.getvalue())
+        self.assertNotIn("Book not found.", output.getvalue())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,87 @@
-from manage_books import BookManager, SimpleBookSearchStrategy, AdvancedBookSearchStrategy
-from manage_users import UserManager, SimpleUserSearch
-from manage_checkouts import CheckoutManager
+import argparse
 import sys
+import threading
+import time
+
+class LazyManager:
+    """
+    Builds a manager on first use, or ahead of time in a background thread
+
+    Attribute access is forwarded to the built manager, so callers use it
+    exactly like the manager itself.
+    """
+    def __init__(self, factory):
+        self._factory = factory
+        self._manager = None
+        self._error = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """
+        Starts building the manager in a background thread
+        """
+        with self._lock:
+            if self._manager is None and self._thread is None:
+                self._thread = threading.Thread(target=self._build, daemon=True)
+                self._thread.start()
+
+    def get(self):
+        """
+        Returns the manager, waiting for the background build if one is running
+        """
+        if self._manager is None:
+            self.warm_up()
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._manager
+
+    def is_ready(self):
+        return self._manager is not None
+
+    def _build(self):
+        try:
+            manager = self._factory()
+            with self._lock:
+                if self._manager is None:
+                    self._manager = manager
+        except Exception as e:
+            self._error = e
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+def load_users():
+    from manage_users import UserManager
+    return UserManager()
+
+def load_books(stats=None):
+    from manage_books import BookManager
+    return BookManager(stats)
+
+def load_checkouts(stats=None):
+    from manage_checkouts import CheckoutManager
+    return CheckoutManager(stats)
+
+class ScriptedInput:
+    """
+    Replaces input() with answers read line by line from a file or stdin
+
+    Prompts and answers are echoed so batch runs produce a readable transcript.
+    The program exits once the script is exhausted.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __call__(self, prompt=""):
+        line = self.stream.readline()
+        if not line:
+            print("\nEnd of batch input. Exiting the program.")
+            sys.exit()
+        answer = line.rstrip("\r\n")
+        print(f"{prompt}{answer}")
+        return answer
 
 def print_menu():
     print("\nLibrary Management System")
@@ -31,22 +111,39 @@ def validate_dob(dob):
     dob_regex = r'^\d{4}-\d{2}-\d{2}$'
     return re.match(dob_regex, dob)
 
-def main():
-    book_manager = BookManager()
-    user_manager = UserManager()
-    checkout_manager = CheckoutManager()
+def main(read=input):
+    """
+    Runs the menu loop
+
+    Args:
+        read (callable): Function used to read answers, input() by default
+    """
+    started = time.perf_counter()
+    from manage_users import SimpleUserSearch, EmailUserSearch
+    from manage_books import SimpleBookSearchStrategy, AdvancedBookSearchStrategy
+    from manage_stats import LibraryStats
+    # Users are needed to log in, the catalog and history warm up meanwhile
+    user_manager = load_users()
+    # Books and loans share one set of dashboard counters
+    stats = LibraryStats()
+    book_manager = LazyManager(lambda: load_books(stats))
+    checkout_manager = LazyManager(lambda: load_checkouts(stats))
+    book_manager.warm_up()
+    checkout_manager.warm_up()
     authenticated_user = None
+    loading = "" if book_manager.is_ready() and checkout_manager.is_ready() else " (catalog and history loading in background)"
+    print(f"Ready in {(time.perf_counter() - started) * 1000:.1f} ms{loading}")
 
     while True:
         if authenticated_user is None:
             print("\nWelcome to the Library Management System!")
-            login_choice = input("Do you have an account? (yes/no): ").lower()
+            login_choice = read("Do you have an account? (yes/no): ").lower()
             if login_choice == "yes":
-                email = input("Enter your email: ")
+                email = read("Enter your email: ")
                 if not validate_email(email):
                     print("Invalid email format. Please enter a valid email.")
                     continue
-                user = user_manager.search_users(email, SimpleUserSearch())
+                user = user_manager.search_users(email, EmailUserSearch())
                 if user:
                     authenticated_user = user[0]
                     print(f"Welcome back, {authenticated_user.name}!")
@@ -54,12 +151,12 @@ def main():
                     print("User not found. Please try again.")
                     continue
             elif login_choice == "no":
-                name = input("Enter your name: ")
-                email = input("Enter your email: ")
+                name = read("Enter your name: ")
+                email = read("Enter your email: ")
                 if not validate_email(email):
                     print("Invalid email format. Please enter a valid email.")
                     continue
-                dob = input("Enter your date of birth (YYYY-MM-DD): ")
+                dob = read("Enter your date of birth (YYYY-MM-DD): ")
                 if not validate_dob(dob):
                     print("Invalid date of birth format. Please enter a valid date in YYYY-MM-DD format.")
                     continue
@@ -70,27 +167,27 @@ def main():
                 continue
 
         print_menu()
-        choice = input("Enter your choice: ")
+        choice = read("Enter your choice: ")
 
         if choice == "1":
             if authenticated_user:
-                title = input("Enter the title of the book: ")
-                author = input("Enter the author of the book: ")
-                isbn = input("Enter the ISBN of the book: ")
+                title = read("Enter the title of the book: ")
+                author = read("Enter the author of the book: ")
+                isbn = read("Enter the ISBN of the book: ")
                 book_manager.add_book(title, author, isbn)
             else:
                 print("Please log in or create an account to add a book.")
 
         elif choice == "2":
             if authenticated_user:
-                isbn = input("Enter the ISBN of the book to remove: ")
+                isbn = read("Enter the ISBN of the book to remove: ")
                 book_manager.remove_book(isbn)
             else:
                 print("Please log in or create an account to remove a book.")
 
         elif choice == "3":
-            query = input("Enter your search query: ")
-            search_strategy = input("Enter search strategy (simple/advanced): ").lower()
+            query = read("Enter your search query: ")
+            search_strategy = read("Enter search strategy (simple/advanced): ").lower()
             if search_strategy == "simple":
                 books = book_manager.search_book(query, SimpleBookSearchStrategy())
             elif search_strategy == "advanced":
@@ -108,12 +205,12 @@ def main():
             if authenticated_user:
                 print("You are already logged in.")
             else:
-                name = input("Enter your name: ")
-                email = input("Enter your email: ")
+                name = read("Enter your name: ")
+                email = read("Enter your email: ")
                 if not validate_email(email):
                     print("Invalid email format. Please enter a valid email.")
                     continue
-                dob = input("Enter your date of birth (YYYY-MM-DD): ")
+                dob = read("Enter your date of birth (YYYY-MM-DD): ")
                 if not validate_dob(dob):
                     print("Invalid date of birth format. Please enter a valid date in YYYY-MM-DD format.")
                     continue
@@ -122,7 +219,7 @@ def main():
 
         elif choice == "5":
             if authenticated_user:
-                query = input("Enter your search query: ")
+                query = read("Enter your search query: ")
                 users = user_manager.search_users(query, SimpleUserSearch())
                 if users:
                     for user in users:
@@ -134,8 +231,8 @@ def main():
 
         elif choice == "6":
             if authenticated_user:
-                isbn = input("Enter the ISBN of the book to checkout: ")
-                book = next((b for b in book_manager.books if b.isbn == isbn), None)
+                isbn = read("Enter the ISBN of the book to checkout: ")
+                book = book_manager._find_book_by_isbn(isbn)
                 if book:
                     checkout_manager.checkout_book(authenticated_user, book)
                 else:
@@ -145,8 +242,8 @@ def main():
 
         elif choice == "7":
             if authenticated_user:
-                isbn = input("Enter the ISBN of the book to return: ")
-                book = next((b for b in book_manager.books if b.isbn == isbn), None)
+                isbn = read("Enter the ISBN of the book to return: ")
+                book = book_manager._find_book_by_isbn(isbn)
                 if book:
                     checkout_manager.return_book(authenticated_user, book)
                 else:
@@ -169,5 +266,18 @@ def main():
         else:
             print("Invalid choice. Please enter a valid option.")
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Library Management System")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="read answers line by line from FILE ('-' for stdin) instead of prompting")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.batch is None:
+        main()
+    elif args.batch == "-":
+        main(ScriptedInput(sys.stdin))
+    else:
+        with open(args.batch) as script:
+            main(ScriptedInput(script))
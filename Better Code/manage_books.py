@@ -1,4 +1,5 @@
 import re 
+from manage_stats import LibraryStats
 
 class Book:
     """
@@ -72,8 +73,10 @@ class AdvancedBookSearchStrategy(BookSearchStrategy):
 class BookManager:
     """Manage all books
     """
-    def __init__(self) -> None:
+    def __init__(self, stats=None) -> None:
         self.books = []
+        self.books_by_isbn = {}
+        self.stats = stats if stats is not None else LibraryStats()
     
     def add_book(self, title, author, isbn):
         """Add a book to the library
@@ -84,6 +87,7 @@ class BookManager:
             isbn (str): ISBN of the book
         """
         try:
+            isbn = self._normalize_isbn(isbn)
             # Check if book exists with same ISBN
             if self._find_book_by_isbn(isbn):
                 print("Book with same ISBN already exists.")
@@ -96,7 +100,7 @@ class BookManager:
             # Add the book
             book_builder = BookBuilder().with_title(title).with_author(author).with_isbn(isbn)
             new_book = book_builder.build()
-            self.books.append(new_book)
+            self.register_book(new_book)
             print("Book added successfully !")
 
             return True
@@ -116,9 +120,12 @@ class BookManager:
                 False if book is not found
         """
         try:
+            isbn = self._normalize_isbn(isbn)
             for index, book in enumerate(self.books):
                 if book.isbn == isbn:
                     self.books.pop(index)
+                    del self.books_by_isbn[isbn]
+                    self.stats.book_removed(book)
                     print("Book successfully removed")
                     return True
             print("Requested book not found")
@@ -128,6 +135,16 @@ class BookManager:
             print(f"An error occurred while removing the book: {e}")
             return False
     
+    def register_book(self, book):
+        """Adds an already validated Book to the library without any output
+
+        Args:
+            book (Book): Book to add
+        """
+        self.books.append(book)
+        self.books_by_isbn[book.isbn] = book
+        self.stats.book_added(book)
+
     def get_all_books(self):
         """ 
         Returns:
@@ -161,10 +178,18 @@ class BookManager:
         Returns:
             Book or None: Book object if found, None otherwise
         """
-        for book in self.books:
-            if book.isbn == isbn:
-                return book
-        return None
+        return self.books_by_isbn.get(self._normalize_isbn(isbn))
+
+    def _normalize_isbn(self, isbn):
+        """Internal method to bring an ISBN to the form used as index key
+
+        Args:
+            isbn (str): ISBN, possibly with hyphens or spaces
+
+        Returns:
+            str: ISBN without hyphens or spaces, in upper case
+        """
+        return isbn.replace("-", "").replace(" ", "").upper()
     
     def _isbn_checker(self, isbn) -> bool:
         """Internal method to validate ISBN-10 and ISBN-13
@@ -176,7 +201,7 @@ class BookManager:
             Book or None: Book object if found, None otherwise
         """
             
-        isbn = isbn.replace("-", "").replace(" ", "").upper();
+        isbn = self._normalize_isbn(isbn)
         match = re.search(r'^(\d{9})(\d|X)$', isbn)
         if not match:
             return False
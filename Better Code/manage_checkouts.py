@@ -1,4 +1,5 @@
 from datetime import datetime
+from manage_stats import LibraryStats
 
 class Checkout:
     """
@@ -32,17 +33,41 @@ class CheckoutHistory:
         """
         self.history.append(checkout)
 
+class BatchItemResult:
+    """
+    Outcome of a single (user, isbn) item in a batch operation
+    """
+    def __init__(self, user, isbn, success=False, message=""):
+        self.user = user # User Object
+        self.isbn = isbn
+        self.success = success
+        self.message = message
+
+    def __str__(self) -> str:
+        status = "OK" if self.success else "FAILED"
+        return f"User: {self.user.name}, ISBN: {self.isbn}, Status: {status}, Message: {self.message}"
+
 class CheckoutManager:
     """
     Manages all checkouts
+
+    Pass the owning BookManager's stats to keep its dashboard counters in
+    step with loans. Without them, loans are not counted on any dashboard.
     """
     _instance = None
 
-    def __new__(cls):
+    def __new__(cls, stats=None):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.checkouts = []
+            cls._instance.active_checkouts = {}
             cls._instance.history = CheckoutHistory()
+            cls._instance.stats = LibraryStats()
+        if stats is not None and stats is not cls._instance.stats:
+            # Loans counted so far would be lost from the dashboard
+            if cls._instance.active_checkouts:
+                raise ValueError("Cannot bind different stats while loans are active")
+            cls._instance.stats = stats
         return cls._instance
 
     def checkout_book(self, user, book) -> bool:
@@ -52,6 +77,9 @@ class CheckoutManager:
             user (User): User object
             book (Book): Book object
         """
+        checkout_instance = None
+        user_states = {user.user_id: (user.active_books, user.books_borrowed)}
+        log_lengths = (len(self.checkouts), len(self.history.history))
         # Ensure Transaction Atomicity
         try:
             # Check if book is available or not
@@ -65,26 +93,14 @@ class CheckoutManager:
 
             # Create a checkout instance
             checkout_instance = Checkout(user, book)
-            # Add it to user's active books list
-            user.add_active_book()
-            # Log it
-            self.checkouts.append(checkout_instance)
-            self.history.add_to_history(checkout_instance)
-            # Book is no longer available
-            book.set_availability(False)
+            self.record_checkout(checkout_instance)
             # print the message
             print("Book checked out successfully")
             return True
         except Exception as e:
             # If an error occurs, rollback changes
-            if checkout_instance in self.checkouts:
-                self.checkouts.remove(checkout_instance)
-            if checkout_instance in self.history.history:
-                self.history.history.remove(checkout_instance)
-            if not book.available:
-                book.set_availability(True)
-            if user.has_reached_limit():
-                user.dcr_active_book()
+            if checkout_instance is not None:
+                self._rollback_checkouts([checkout_instance], user_states, log_lengths)
             print(f"An error occurred during checkout: {e}")
             return False
 
@@ -96,28 +112,189 @@ class CheckoutManager:
             book (Book): Book object
         """
         try:
-            for checkout in self.checkouts:
-                if checkout.user.user_id == user.user_id and checkout.book.isbn == book.isbn:
-                    # return the book
-                    return_status = checkout.return_book()
-                    # Check if already returned or not
-                    if not return_status:
-                        print("Book already returned")
-                        return False
-
-                    # Decrement user's active books list
-                    user.dcr_active_book()
-                    # set availability of book
-                    book.set_availability(True)
-                    print("Book returned successfully!")
-                    return True
-
-            print("No matching checkout found for the user and book combination")
-            return False
+            checkout = self.active_checkouts.get((user.user_id, book.isbn))
+            if checkout is None:
+                print("No matching checkout found for the user and book combination")
+                return False
+
+            # return the book
+            checkout.return_book()
+            del self.active_checkouts[(user.user_id, book.isbn)]
+            # Decrement user's active books list
+            user.dcr_active_book()
+            # set availability of book
+            book.set_availability(True)
+            self.stats.loan_ended(checkout)
+            print("Book returned successfully!")
+            return True
         except Exception as e:
             print(f"An error occurred during return: {e}")
             return False
 
+    def record_checkout(self, checkout, new=True):
+        """Records an already validated checkout
+
+        Args:
+            checkout (Checkout): Checkout instance to record
+            new (bool): False for loans that are not borrowed today, e.g. migrated legacy loans
+        """
+        # Add it to user's active books list
+        checkout.user.add_active_book()
+        # Log it
+        self.checkouts.append(checkout)
+        self.active_checkouts[(checkout.user.user_id, checkout.book.isbn)] = checkout
+        self.history.add_to_history(checkout)
+        # Book is no longer available
+        checkout.book.set_availability(False)
+        self.stats.loan_started(checkout, new=new)
+
+    def checkout_books(self, requests, book_manager):
+        """Checkout many books in a single all-or-nothing batch
+
+        Every item is validated before anything is applied. If any item fails
+        validation, or an error occurs while applying, no checkout is kept.
+
+        Args:
+            requests (list(tuple(User, str))): (user, isbn) pairs to checkout
+            book_manager (BookManager): Manager owning the books to resolve
+
+        Returns:
+            list(BatchItemResult): One result per requested item, in order
+        """
+        results = [BatchItemResult(user, isbn) for user, isbn in requests]
+        pending = {}
+        claimed = set()
+        resolved = []
+
+        # Validation pass
+        for result in results:
+            user, isbn = result.user, result.isbn
+            book = book_manager._find_book_by_isbn(isbn)
+            if book is None:
+                result.message = "Book not found"
+            elif not book.available or book.isbn in claimed:
+                result.message = f"Book {book.title} with ISBN {book.isbn} not available for checkout"
+            elif user.active_books + pending.get(user.user_id, 0) >= user.borrow_limit:
+                result.message = f"User {user.name} has borrowed too many books."
+            else:
+                claimed.add(book.isbn)
+                pending[user.user_id] = pending.get(user.user_id, 0) + 1
+                resolved.append((result, book))
+
+        if len(resolved) != len(results):
+            self._abort_batch(results)
+            print(f"Batch checkout aborted: {len(results) - len(resolved)} of {len(results)} items failed validation")
+            return results
+
+        # Apply pass
+        user_states = {result.user.user_id: (result.user.active_books, result.user.books_borrowed) for result in results}
+        log_lengths = (len(self.checkouts), len(self.history.history))
+        applied = []
+        try:
+            for result, book in resolved:
+                checkout_instance = Checkout(result.user, book)
+                applied.append(checkout_instance)
+                self.record_checkout(checkout_instance)
+                result.success = True
+                result.message = "Book checked out successfully"
+        except Exception as e:
+            self._rollback_checkouts(applied, user_states, log_lengths)
+            self._abort_batch(results)
+            print(f"An error occurred during batch checkout: {e}")
+            return results
+
+        print(f"Batch checkout completed: {len(applied)} books checked out")
+        return results
+
+    def return_books(self, requests, book_manager):
+        """Return many books in a single all-or-nothing batch
+
+        Args:
+            requests (list(tuple(User, str))): (user, isbn) pairs to return
+            book_manager (BookManager): Manager owning the books to resolve
+
+        Returns:
+            list(BatchItemResult): One result per requested item, in order
+        """
+        results = [BatchItemResult(user, isbn) for user, isbn in requests]
+        claimed = set()
+        resolved = []
+
+        # Validation pass
+        for result in results:
+            book = book_manager._find_book_by_isbn(result.isbn)
+            key = None if book is None else (result.user.user_id, book.isbn)
+            if book is None:
+                result.message = "Book not found"
+            elif key not in self.active_checkouts or key in claimed:
+                result.message = "No matching checkout found for the user and book combination"
+            else:
+                # Each active checkout can only be returned once per batch
+                claimed.add(key)
+                resolved.append((result, self.active_checkouts[key]))
+
+        if len(resolved) != len(results):
+            self._abort_batch(results)
+            print(f"Batch return aborted: {len(results) - len(resolved)} of {len(results)} items failed validation")
+            return results
+
+        # Apply pass
+        user_states = {result.user.user_id: (result.user.active_books, result.user.books_borrowed) for result in results}
+        applied = []
+        try:
+            for result, checkout in resolved:
+                checkout.return_book()
+                applied.append(checkout)
+                del self.active_checkouts[(checkout.user.user_id, checkout.book.isbn)]
+                result.user.dcr_active_book()
+                checkout.book.set_availability(True)
+                self.stats.loan_ended(checkout)
+                result.success = True
+                result.message = "Book returned successfully!"
+        except Exception as e:
+            for checkout in reversed(applied):
+                checkout.return_date = None
+                self.active_checkouts[(checkout.user.user_id, checkout.book.isbn)] = checkout
+                checkout.user.active_books, checkout.user.books_borrowed = user_states[checkout.user.user_id]
+                checkout.book.set_availability(False)
+                self.stats.loan_started(checkout, new=False)
+            self._abort_batch(results)
+            print(f"An error occurred during batch return: {e}")
+            return results
+
+        print(f"Batch return completed: {len(applied)} books returned")
+        return results
+
+    def _abort_batch(self, results):
+        """Internal method to mark every item of a batch as not applied
+
+        Args:
+            results (list(BatchItemResult)): Results of the aborted batch
+        """
+        for result in results:
+            if result.success or not result.message:
+                result.message = "Batch aborted"
+            result.success = False
+
+    def _rollback_checkouts(self, applied, user_states, log_lengths):
+        """Internal method to undo checkouts that were (partially) applied
+
+        Args:
+            applied (list(Checkout)): Checkout instances to undo, in the order they were applied
+            user_states (dict): User ID to the user's (active_books, books_borrowed) before the checkouts
+            log_lengths (tuple(int, int)): Lengths of checkouts and history before the checkouts
+        """
+        for checkout in reversed(applied):
+            self.stats.loan_ended(checkout, cancelled=True)
+            if self.active_checkouts.get((checkout.user.user_id, checkout.book.isbn)) is checkout:
+                del self.active_checkouts[(checkout.user.user_id, checkout.book.isbn)]
+            checkout.book.set_availability(True)
+            checkout.user.active_books, checkout.user.books_borrowed = user_states[checkout.user.user_id]
+        # Applied checkouts were appended last, so dropping the tail undoes them
+        checkouts_length, history_length = log_lengths
+        del self.checkouts[checkouts_length:]
+        del self.history.history[history_length:]
+
     def get_checkout_history(self):
         """
         Returns the checkout history
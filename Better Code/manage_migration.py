@@ -0,0 +1,167 @@
+import argparse
+import json
+import time
+from collections import Counter
+from itertools import islice
+
+from manage_books import BookManager, BookBuilder
+from manage_users import UserManager
+from manage_checkouts import CheckoutManager, Checkout
+
+class MigrationReport:
+    """
+    Counts migrated and skipped records of one kind of legacy data
+    """
+    def __init__(self, kind):
+        self.kind = kind
+        self.migrated = 0
+        self.skipped = Counter()
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def skip(self, reason):
+        self.skipped[reason] += 1
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self.started
+        return self
+
+    def throughput(self):
+        """
+        Returns:
+            float: Records processed per second
+        """
+        total = self.migrated + sum(self.skipped.values())
+        return total / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        skipped = ", ".join(f"{reason}: {count}" for reason, count in self.skipped.items()) or "none"
+        return (f"{self.kind}: {self.migrated} migrated, skipped ({skipped}), "
+                f"{self.elapsed:.2f}s, {self.throughput():.0f} records/s")
+
+def iter_jsonl(path):
+    """
+    Streams legacy dict records from a JSON Lines file, one record at a time
+    """
+    with open(path) as records:
+        for line in records:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+def batched(records, batch_size):
+    """
+    Splits any iterable of records into lists of at most batch_size records
+    """
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+class LegacyMigrator:
+    """
+    Converts legacy "Redesigning Poor Code" dict records into Book, User and Checkout models
+
+    Records are consumed in batches from any iterable, so only one batch of
+    legacy data is held in memory at a time. Duplicates and references are
+    resolved through the managers' ISBN and user ID indexes.
+    """
+    def __init__(self, book_manager=None, user_manager=None, checkout_manager=None, batch_size=1000):
+        self.book_manager = book_manager or BookManager()
+        self.user_manager = user_manager or UserManager()
+        self.checkout_manager = checkout_manager or CheckoutManager(self.book_manager.stats)
+        self.batch_size = batch_size
+
+    def migrate_books(self, records):
+        """Migrates legacy {"title", "author", "isbn"} records
+
+        Returns:
+            MigrationReport
+        """
+        report = MigrationReport("books")
+        for batch in batched(records, self.batch_size):
+            for record in batch:
+                isbn = self.book_manager._normalize_isbn(str(record.get("isbn", "")))
+                if not self.book_manager._isbn_checker(isbn):
+                    report.skip("invalid ISBN")
+                elif self.book_manager._find_book_by_isbn(isbn):
+                    report.skip("duplicate ISBN")
+                else:
+                    book = BookBuilder().with_title(record.get("title", "")).with_author(record.get("author", "")).with_isbn(isbn).build()
+                    self.book_manager.register_book(book)
+                    report.migrated += 1
+        return report.finish()
+
+    def migrate_users(self, records):
+        """Migrates legacy {"name", "user_id"} records, keeping the legacy user ID
+
+        Returns:
+            MigrationReport
+        """
+        report = MigrationReport("users")
+        for batch in batched(records, self.batch_size):
+            for record in batch:
+                user_id = record.get("user_id")
+                if user_id in (None, ""):
+                    report.skip("missing user ID")
+                elif self.user_manager._find_user_by_id(str(user_id)):
+                    report.skip("duplicate user")
+                else:
+                    # Legacy records carry no email or date of birth
+                    self.user_manager.add_user(record.get("name", ""), record.get("email", ""), record.get("dob", ""), user_id=str(user_id))
+                    report.migrated += 1
+        return report.finish()
+
+    def migrate_checkouts(self, records):
+        """Migrates legacy {"user_id", "isbn"} records as active checkouts
+
+        Returns:
+            MigrationReport
+        """
+        report = MigrationReport("checkouts")
+        for batch in batched(records, self.batch_size):
+            for record in batch:
+                user = self.user_manager._find_user_by_id(str(record.get("user_id")))
+                book = self.book_manager._find_book_by_isbn(str(record.get("isbn")))
+                if user is None:
+                    report.skip("unknown user")
+                elif book is None:
+                    report.skip("unknown book")
+                elif not book.available:
+                    report.skip("book already checked out")
+                else:
+                    # Legacy loans are history, not today's borrows
+                    self.checkout_manager.record_checkout(Checkout(user, book), new=False)
+                    report.migrated += 1
+        return report.finish()
+
+    def migrate(self, books=(), users=(), checkouts=()):
+        """Migrates books and users first so checkouts can reference them
+
+        Returns:
+            list(MigrationReport)
+        """
+        reports = [self.migrate_books(books), self.migrate_users(users), self.migrate_checkouts(checkouts)]
+        for report in reports:
+            print(report)
+        return reports
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate legacy Library Management System data")
+    parser.add_argument("--books", help="JSON Lines file of legacy book records")
+    parser.add_argument("--users", help="JSON Lines file of legacy user records")
+    parser.add_argument("--checkouts", help="JSON Lines file of legacy checkout records")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    migrator = LegacyMigrator(batch_size=args.batch_size)
+    migrator.migrate(
+        books=iter_jsonl(args.books) if args.books else (),
+        users=iter_jsonl(args.users) if args.users else (),
+        checkouts=iter_jsonl(args.checkouts) if args.checkouts else (),
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+from datetime import date
+
+class LibraryStats:
+    """
+    Incrementally maintained dashboard counters
+
+    Each BookManager owns one and updates it as books are added or removed.
+    A CheckoutManager given the same object updates it as loans change, so
+    every read is O(1) regardless of the size of the library. Loans of books
+    outside this catalogue are ignored.
+    """
+    top_size = 10
+
+    def __init__(self):
+        self.total_books = 0
+        self.available_books = 0
+        self.active_loans = 0
+        self.loans_by_user = {}
+        self.catalogue = {}
+        self.on_loan = set()
+        self.day = date.today()
+        self.borrowed_today = {}
+        self.titles_today = {}
+        self.top_today = []
+
+    def book_added(self, book):
+        self.catalogue[book.isbn] = book
+        self.total_books += 1
+        if book.available:
+            self.available_books += 1
+
+    def book_removed(self, book):
+        # A removed book that is on loan stays counted as a loan until returned
+        self.catalogue.pop(book.isbn, None)
+        self.total_books -= 1
+        if book.available:
+            self.available_books -= 1
+
+    def loan_started(self, checkout, new=True):
+        """
+        Records a book leaving the shelf
+
+        Args:
+            checkout (Checkout): Checkout instance
+            new (bool): False when the loan is not a borrow made today, e.g. a restored return or a migrated loan
+        """
+        if not self._is_catalogued(checkout.book) or checkout in self.on_loan:
+            return
+        self.on_loan.add(checkout)
+        self.available_books -= 1
+        self.active_loans += 1
+        user_id = checkout.user.user_id
+        self.loans_by_user[user_id] = self.loans_by_user.get(user_id, 0) + 1
+        if new:
+            self._count_borrow(checkout.book)
+
+    def loan_ended(self, checkout, cancelled=False):
+        """
+        Records a book coming back to the shelf
+
+        Args:
+            checkout (Checkout): Checkout instance
+            cancelled (bool): True when the checkout is rolled back and should not count as borrowed
+        """
+        # Only loans recorded by loan_started are undone
+        if checkout not in self.on_loan:
+            return
+        self.on_loan.remove(checkout)
+        if self._is_catalogued(checkout.book):
+            self.available_books += 1
+        self.active_loans -= 1
+        user_id = checkout.user.user_id
+        remaining = self.loans_by_user.get(user_id, 0) - 1
+        if remaining > 0:
+            self.loans_by_user[user_id] = remaining
+        else:
+            self.loans_by_user.pop(user_id, None)
+        if cancelled:
+            self._uncount_borrow(checkout.book)
+
+    def loans_for(self, user_id):
+        """
+        Returns:
+            int: Number of active loans of the user
+        """
+        return self.loans_by_user.get(user_id, 0)
+
+    def most_borrowed_today(self):
+        """
+        Returns:
+            list(tuple(str, str, int)): (isbn, title, count) of today's most borrowed books, most borrowed first
+        """
+        if self.day != date.today():
+            return []
+        return [(isbn, title, count) for count, isbn, title in self.top_today]
+
+    def _is_catalogued(self, book):
+        return self.catalogue.get(book.isbn) is book
+
+    def _roll_day(self):
+        today = date.today()
+        if self.day != today:
+            self.day = today
+            self.borrowed_today = {}
+            self.titles_today = {}
+            self.top_today = []
+
+    def _count_borrow(self, book):
+        self._roll_day()
+        count = self.borrowed_today.get(book.isbn, 0) + 1
+        self.borrowed_today[book.isbn] = count
+        self.titles_today[book.isbn] = book.title
+        # Counts only grow during a day, so the top list only needs the changed entry
+        self.top_today = [entry for entry in self.top_today if entry[1] != book.isbn]
+        self.top_today.append((count, book.isbn, book.title))
+        self.top_today.sort(key=lambda entry: -entry[0])
+        del self.top_today[self.top_size:]
+
+    def _uncount_borrow(self, book):
+        if self.day != date.today() or book.isbn not in self.borrowed_today:
+            return
+        count = self.borrowed_today[book.isbn] - 1
+        if count > 0:
+            self.borrowed_today[book.isbn] = count
+        else:
+            del self.borrowed_today[book.isbn]
+            del self.titles_today[book.isbn]
+        if any(entry[1] == book.isbn for entry in self.top_today):
+            # Rollbacks are rare, rebuild the top list from today's counts
+            ranked = sorted(self.borrowed_today.items(), key=lambda item: -item[1])[:self.top_size]
+            self.top_today = [(count, isbn, self.titles_today[isbn]) for isbn, count in ranked]
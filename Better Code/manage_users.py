@@ -1,5 +1,7 @@
 from uuid import uuid4
 from datetime import datetime
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
 
 class User:
     def __init__(self, email, name, dob, user_id=None, joining_date=None) -> None:
@@ -66,7 +68,143 @@ class SimpleUserSearch(UserSearch):
                 results.append(user)
         return results
     
-# Compatible with Advanced Search Strategies, too
+class UserIndex:
+    """
+    Maintains lookup indexes over users
+
+    Hash indexes serve exact email, name token and email domain lookups.
+    Sorted lists of the distinct emails and name tokens serve prefix queries,
+    and sorted lists of the distinct dates serve date of birth and joining
+    date range queries. Each sorted key maps to the users sharing it.
+    """
+    def __init__(self):
+        self.by_user_id = {}
+        self.email_keys = []
+        self.by_email = {}
+        self.name_token_keys = []
+        self.by_name_token = {}
+        self.by_domain = {}
+        self.dob_keys = []
+        self.by_dob = {}
+        self.joining_keys = []
+        self.by_joining_date = {}
+
+    def add(self, user):
+        """
+        Adds a user to every index, skipping empty fields
+        """
+        self.by_user_id[user.user_id] = user
+        email = user.email.lower()
+        if email:
+            self._add_sorted(self.email_keys, self.by_email, email, user)
+            self.by_domain.setdefault(email.rpartition("@")[2], []).append(user)
+        for token in set(user.name.lower().split()):
+            self._add_sorted(self.name_token_keys, self.by_name_token, token, user)
+        if user.dob:
+            self._add_sorted(self.dob_keys, self.by_dob, str(user.dob), user)
+        if user.joining_date:
+            self._add_sorted(self.joining_keys, self.by_joining_date, str(user.joining_date), user)
+
+    def _add_sorted(self, keys, by_key, key, user):
+        users = by_key.get(key)
+        if users is None:
+            # Only a key not seen before pays for a sorted insert
+            insort(keys, key)
+            users = by_key[key] = []
+        users.append(user)
+
+    @staticmethod
+    def prefix_keys(keys, prefix):
+        """
+        Returns the sorted keys starting with prefix
+        """
+        return keys[bisect_left(keys, prefix):bisect_right(keys, prefix + "\uffff")]
+
+    @staticmethod
+    def range(keys, by_date, start, end, offset=0, limit=None):
+        """
+        Returns up to limit users, after skipping offset, whose date lies within [start, end]
+        """
+        low = 0 if start is None else bisect_left(keys, str(start))
+        high = len(keys) if end is None else bisect_right(keys, str(end))
+        results = []
+        for position in range(low, high):
+            users = by_date[keys[position]]
+            if offset >= len(users):
+                offset -= len(users)
+                continue
+            wanted = len(users) if limit is None else offset + limit - len(results)
+            results.extend(users[offset:wanted])
+            offset = 0
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+def _page(users, offset, limit):
+    """
+    Returns the [offset, offset + limit) slice of a list of users
+    """
+    return users[offset:] if limit is None else users[offset:offset + limit]
+
+class IndexedUserSearch(UserSearch):
+    """Strategy interface for searching users through a UserIndex"""
+    def search(self, index, query, offset=0, limit=None):
+        raise NotImplementedError
+
+class EmailUserSearch(IndexedUserSearch):
+    """Exact, case-insensitive email lookup"""
+    def search(self, index, query, offset=0, limit=None):
+        return _page(index.by_email.get(query.strip().lower(), []), offset, limit)
+
+class EmailPrefixUserSearch(IndexedUserSearch):
+    """Users whose email starts with the query, e.g. the beginning of the local part"""
+    def search(self, index, query, offset=0, limit=None):
+        prefix = query.strip().lower()
+        if not prefix:
+            return []
+        matches = (user for email in index.prefix_keys(index.email_keys, prefix) for user in index.by_email[email])
+        return list(islice(matches, offset, None if limit is None else offset + limit))
+
+class NameTokenUserSearch(IndexedUserSearch):
+    """Users whose name has a word starting with each word of the query"""
+    def search(self, index, query, offset=0, limit=None):
+        tokens = set(query.lower().split())
+        if not tokens:
+            return []
+        # Scan only the users of the longest, most selective prefix and check each candidate's own name
+        prefix = max(tokens, key=len)
+        matches = (user for user in self._candidates(index, prefix) if self._matches(user, tokens))
+        return list(islice(matches, offset, None if limit is None else offset + limit))
+
+    def _candidates(self, index, prefix):
+        seen = set()
+        for token in index.prefix_keys(index.name_token_keys, prefix):
+            for user in index.by_name_token[token]:
+                # A user with several words sharing the prefix is listed once
+                if user.user_id not in seen:
+                    seen.add(user.user_id)
+                    yield user
+
+    def _matches(self, user, tokens):
+        words = user.name.lower().split()
+        return all(any(word.startswith(token) for word in words) for token in tokens)
+
+class EmailDomainUserSearch(IndexedUserSearch):
+    """Users whose email belongs to the given domain"""
+    def search(self, index, query, offset=0, limit=None):
+        return _page(index.by_domain.get(query.strip().lower().lstrip("@"), []), offset, limit)
+
+class DobRangeUserSearch(IndexedUserSearch):
+    """Users born within an inclusive (start, end) range of YYYY-MM-DD dates, either bound may be None"""
+    def search(self, index, query, offset=0, limit=None):
+        start, end = query
+        return index.range(index.dob_keys, index.by_dob, start, end, offset, limit)
+
+class JoiningDateRangeUserSearch(IndexedUserSearch):
+    """Users who joined within an inclusive (start, end) range of dates, either bound may be None"""
+    def search(self, index, query, offset=0, limit=None):
+        start, end = query
+        return index.range(index.joining_keys, index.by_joining_date, start, end, offset, limit)
 
 class UserManager:
     _instance = None
@@ -75,13 +213,44 @@ class UserManager:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.users = []
+            cls._instance.index = UserIndex()
         return cls._instance
 
-    def add_user(self, name, email, dob):
-        user = UserBuilder(email, name, dob).build()
+    def add_user(self, name, email, dob, user_id=None):
+        user = UserBuilder(email, name, dob).set_user_id(user_id).build()
         self.users.append(user)
+        self.index.add(user)
         return user
         print("User added successfully")
 
-    def search_users(self, query, search_strategy):
-        return search_strategy.search(self.users, query)
+    def search_users(self, query, search_strategy, page=None, page_size=20):
+        """
+        Search for users
+
+        Args:
+            query: Query to search for, a (start, end) tuple for range strategies
+            search_strategy (UserSearch): Strategy for searching users
+            page (int): 1-based page number, all results are returned if None
+            page_size (int): Number of users per page
+
+        Returns:
+            list(User): List of found users
+        """
+        if page is not None and (page < 1 or page_size < 1):
+            raise ValueError("page and page_size must be at least 1")
+        offset, limit = (0, None) if page is None else ((page - 1) * page_size, page_size)
+        if isinstance(search_strategy, IndexedUserSearch):
+            # Indexed strategies slice the index directly
+            return search_strategy.search(self.index, query, offset, limit)
+        return _page(search_strategy.search(self.users, query), offset, limit)
+
+    def _find_user_by_id(self, user_id):
+        """Internal method to find a user by user ID
+
+        Args:
+            user_id (str): User ID to search for
+
+        Returns:
+            User or None: User object if found, None otherwise
+        """
+        return self.index.by_user_id.get(user_id)
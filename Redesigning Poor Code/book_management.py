@@ -0,0 +1,8 @@
+from legacy_shim import book_manager
+
+def add_book(title, author, isbn):
+    book_manager.add_book(title, author, isbn)
+
+def list_books():
+    for book in book_manager.get_all_books():
+        print(book)
@@ -0,0 +1,9 @@
+from legacy_shim import book_manager, user_manager, checkout_manager
+
+def checkout_book(user_id, isbn):
+    user = user_manager._find_user_by_id(user_id)
+    book = book_manager._find_book_by_isbn(isbn)
+    if user is None or book is None:
+        print("User or book not found.")
+        return
+    checkout_manager.checkout_book(user, book)
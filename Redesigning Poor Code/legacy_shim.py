@@ -0,0 +1,14 @@
+# Runs the legacy scripts on top of the "Better Code" managers.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Better Code"))
+
+from manage_books import BookManager
+from manage_users import UserManager
+from manage_checkouts import CheckoutManager
+
+book_manager = BookManager()
+user_manager = UserManager()
+checkout_manager = CheckoutManager(book_manager.stats)
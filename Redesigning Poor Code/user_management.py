@@ -0,0 +1,8 @@
+from legacy_shim import user_manager
+
+def add_user(name, user_id):
+    if user_manager._find_user_by_id(user_id):
+        print("User with same ID already exists.")
+        return
+    # Legacy users carry no email or date of birth
+    user_manager.add_user(name, "", "", user_id=user_id)